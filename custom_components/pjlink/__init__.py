@@ -5,14 +5,16 @@ from __future__ import annotations
 import logging
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST, CONF_PORT, CONF_NAME, CONF_PASSWORD, Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_HOST, CONF_PORT, CONF_NAME, CONF_PASSWORD, EVENT_HOMEASSISTANT_STOP, Platform
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import DOMAIN, CONF_ENCODING
+from .const import DOMAIN, DATA_FLEET, CONF_ENCODING
 from .coordinator import PjLinkDataUpdateCoordinator
+from .fleet import PjLinkFleet
+from .sensor import create_fleet_sensors
 
-PLATFORMS = [Platform.MEDIA_PLAYER, Platform.SELECT, Platform.SWITCH]
+PLATFORMS = [Platform.BUTTON, Platform.MEDIA_PLAYER, Platform.SELECT, Platform.SENSOR, Platform.SWITCH]
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,6 +28,25 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
+    fleet: PjLinkFleet = hass.data.setdefault(DATA_FLEET, PjLinkFleet())
+
+    @callback
+    def _async_coordinator_updated() -> None:
+        fleet.async_update(coordinator)
+        if coordinator.last_update_success:
+            coordinator.usage.async_update(coordinator.data.power, coordinator.data.input)
+        else:
+            coordinator.usage.async_update(None, None)
+
+    entry.async_on_unload(coordinator.async_add_listener(_async_coordinator_updated))
+    _async_coordinator_updated()
+
+    async def _async_flush_usage(event: Event) -> None:
+        # Config entries are not unloaded on shutdown, write the current hour while the recorder runs
+        await coordinator.usage.async_flush(include_current=True)
+
+    entry.async_on_unload(hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_flush_usage))
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
@@ -36,7 +57,16 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.usage.async_flush(include_current=True)
+
+        fleet: PjLinkFleet = hass.data[DATA_FLEET]
+        fleet.async_remove(coordinator)
+
+        # Hand the fleet sensors over to a projector that stays loaded
+        async_add_entities = fleet.async_remove_platform(entry.entry_id)
+        if async_add_entities is not None:
+            async_add_entities(create_fleet_sensors(fleet))
 
     return unload_ok
 
@@ -0,0 +1,49 @@
+"""The button entities for PjLink."""
+
+from __future__ import annotations
+
+from homeassistant.components.button import ButtonEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN
+from .coordinator import PjLinkDataUpdateCoordinator, VOLUME_UP, VOLUME_DOWN
+from .entity import PjLinkCapabilityEntity
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up PjLink button entities based on a config entry."""
+    coordinator: PjLinkDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    entities: list = []
+
+    if coordinator.is_class2:
+        entities.append(PjLinkMicrophoneVolumeButton("microphone_volume_up", "Microphone volume up", "mdi:microphone-plus", VOLUME_UP, coordinator))
+        entities.append(PjLinkMicrophoneVolumeButton("microphone_volume_down", "Microphone volume down", "mdi:microphone-minus", VOLUME_DOWN, coordinator))
+
+    async_add_entities(entities)
+
+
+class PjLinkMicrophoneVolumeButton(PjLinkCapabilityEntity, ButtonEntity):
+    """Representation of a PjLink microphone volume step button."""
+
+    def __init__(
+        self,
+        id: str,
+        name: str,
+        icon: str,
+        direction: str,
+        coordinator: PjLinkDataUpdateCoordinator
+    ) -> None:
+        """Initialize the PjLink microphone volume button."""
+        self.direction = direction
+        PjLinkCapabilityEntity.__init__(self, id, name, icon, coordinator)
+
+    async def async_press(self) -> None:
+        """Step the microphone volume."""
+        self.coordinator.microphone_volume_step(self.direction)
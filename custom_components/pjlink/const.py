@@ -8,5 +8,6 @@ DEFAULT_PORT = 4352
 DEFAULT_ENCODING = "utf-8"
 
 DOMAIN = "pjlink"
+DATA_FLEET = f"{DOMAIN}_fleet"
 
 ERR_PROJECTOR_UNAVAILABLE = "projector unavailable"
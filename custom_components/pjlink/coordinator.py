@@ -4,15 +4,17 @@ from __future__ import annotations
 
 from datetime import timedelta
 import logging
+import time
 from typing import TYPE_CHECKING
 
-from pypjlink import Projector
-from pypjlink.projector import ProjectorError, POWER_STATES, MUTE_AUDIO, POWER_STATES_REV
+from pypjlink import Projector, protocol
+from pypjlink.projector import ProjectorError, POWER_STATES, MUTE_AUDIO, MUTE_VIDEO, POWER_STATES_REV
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import DOMAIN, ERR_PROJECTOR_UNAVAILABLE
+from .usage import PjLinkUsageTracker
 
 if TYPE_CHECKING:
     from .entity import PjLinkDeviceEntity
@@ -20,11 +22,29 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 SCAN_INTERVAL = timedelta(seconds=10)
+SLOW_SCAN_INTERVAL = timedelta(minutes=10)
+
+VOLUME_UP = "1"
+VOLUME_DOWN = "0"
 
 def format_input_source(input_source_name, input_source_number):
     """Format input source for display in UI."""
     return f"{input_source_name} {input_source_number}"
 
+def send_class2_command(projector: Projector, body: str, param: str) -> str:
+    """Send a Class 2 command, pypjlink itself only speaks Class 1."""
+    projector.f.write(f"%2{body} {param}\r")
+    projector.f.flush()
+
+    response = protocol.read_until(projector.f, "\r", projector.encoding)
+    if response[:2] != "%2" or response[2:6].upper() != body or response[6:7] != "=":
+        raise ProjectorError(f"unexpected response {response}")
+
+    response_param = response[7:]
+    if response_param in protocol.ERRORS:
+        raise ProjectorError(protocol.ERRORS[response_param])
+    return response_param
+
 class PjLinkData:
     """Object that holds data for a MusicCast device."""
 
@@ -44,12 +64,19 @@ class PjLinkData:
 
         self.input = None
         self.inputs: Dict[str, str] = {}
-        self.lamps: Dict[int, bool] = {}
+        self.lamps: list[tuple[int, bool]] = []
+        self.lamp_hours: int | None = None
         self.errors: Dict[str, str] = {}
         
         self.video_mute: bool | None = None
         self.audio_mute: bool | None = None
 
+        # class 2
+        self.serial_number: str | None = None
+        self.software_version: str | None = None
+        self.freeze: bool | None = None
+        self.filter_hours: int | None = None
+
 class PjLinkDataUpdateCoordinator(DataUpdateCoordinator[PjLinkData]):
     """Class to manage fetching data from the API."""
 
@@ -61,46 +88,99 @@ class PjLinkDataUpdateCoordinator(DataUpdateCoordinator[PjLinkData]):
         self._password = password
         self._encoding = encoding
 
+        # detected once from CLSS at the first refresh
+        self.pjlink_class: int | None = None
+        self.serial_number: str | None = None
+        self.software_version: str | None = None
+
+        # monotonic time of the last read of slowly changing values
+        self._lamps_read: float | None = None
+        self._filter_read: float | None = None
+
         super().__init__(hass, _LOGGER, name=DOMAIN, update_interval=SCAN_INTERVAL)
         self.entities: list[PjLinkDeviceEntity] = []
+        self.usage = PjLinkUsageTracker(hass, host, name)
 
     async def _async_update_data(self) -> PjLinkData:
         """Update data via library."""
         try:
+            return await self.hass.async_add_executor_job(self.__fetch_data)
+        except ProjectorError as exception:
+            raise UpdateFailed from exception
 
-            with self.projector() as projector:
+    def __fetch_data(self) -> PjLinkData:
+        """Fetch all data in a single session, runs in the executor."""
+        with self.projector() as projector:
 
-                data = PjLinkData()
+            data = PjLinkData()
 
-                data.device_id = self._host
-                data.host = self._host
-                data.name = self._name
-                data.manufacturer = projector.get_manufacturer()
-                data.product_name = projector.get_product_name()
+            data.device_id = self._host
+            data.host = self._host
+            data.name = self._name
+            data.manufacturer = projector.get_manufacturer()
+            data.product_name = projector.get_product_name()
 
-                data.power_state = projector.get_power()
-                data.power = self.__has_power_by_power_state(data.power_state)
+            if self.pjlink_class is None:
+                self.__detect_capabilities(projector)
+            data.serial_number = self.serial_number
+            data.software_version = self.software_version
 
-                try:
-                    input = projector.get_input()
-                    data.input = format_input_source(*input)
-                except Exception as exception:
-                    data.input = None
+            data.power_state = projector.get_power()
+            data.power = self.__has_power_by_power_state(data.power_state)
 
+            try:
+                input = projector.get_input()
+                data.input = format_input_source(*input)
+            except Exception as exception:
+                data.input = None
+
+            try:
+                data.input_list = projector.get_inputs()
+            except Exception as exception:
+                data.input_list = None
+  
+            try:
+                data.video_mute = projector.get_mute()[0]
+                data.audio_mute = projector.get_mute()[1]
+            except Exception as exception:
+                data.video_mute = None
+                data.audio_mute = None
+
+            # lamp hours change slowly, keep the last values between reads
+            if self.data is not None:
+                data.lamps = self.data.lamps
+                data.lamp_hours = self.data.lamp_hours
+
+            if self.__is_due(self._lamps_read):
                 try:
-                    data.input_list = projector.get_inputs()
+                    data.lamps = projector.get_lamps()
+                    data.lamp_hours = sum(hours for hours, _ in data.lamps)
+                    self._lamps_read = time.monotonic()
                 except Exception as exception:
-                    data.input_list = None
-  
+                    _LOGGER.debug("Could not read lamps of %s, keeping the last values", self._host)
+
+            try:
+                data.errors = projector.get_errors()
+            except Exception as exception:
+                data.errors = {}
+
+            if self.is_class2:
                 try:
-                    data.video_mute = projector.get_mute()[0]
-                    data.audio_mute = projector.get_mute()[1]
+                    data.freeze = send_class2_command(projector, "FREZ", "?") == "1"
                 except Exception as exception:
-                    data.video_mute = None
-                    data.audio_mute = None
+                    data.freeze = None
+
+                # filter hours change slowly too
+                if self.data is not None:
+                    data.filter_hours = self.data.filter_hours
+
+                if self.__is_due(self._filter_read):
+                    try:
+                        data.filter_hours = int(send_class2_command(projector, "FILT", "?"))
+                        self._filter_read = time.monotonic()
+                    except Exception as exception:
+                        _LOGGER.debug("Could not read filter usage of %s, keeping the last value", self._host)
 
-        except ProjectorError as exception:
-            raise UpdateFailed from exception
         return data
 
     def projector(self):
@@ -144,6 +224,49 @@ class PjLinkDataUpdateCoordinator(DataUpdateCoordinator[PjLinkData]):
         with self.projector() as projector:
             projector.set_input(*source)
 
+    def freeze(self, freeze: bool) -> None:
+        """Freeze (true) or unfreeze (false) the picture."""
+        with self.projector() as projector:
+            send_class2_command(projector, "FREZ", "1" if freeze else "0")
+
+    def volume_step(self, direction: str) -> None:
+        """Step the speaker volume up or down."""
+        with self.projector() as projector:
+            send_class2_command(projector, "SVOL", direction)
+
+    def microphone_volume_step(self, direction: str) -> None:
+        """Step the microphone volume up or down."""
+        with self.projector() as projector:
+            send_class2_command(projector, "MVOL", direction)
+
+    @property
+    def is_class2(self) -> bool:
+        """Return whether the projector supports PJLink Class 2."""
+        return self.pjlink_class is not None and self.pjlink_class >= 2
+
+    def __detect_capabilities(self, projector) -> None:
+        try:
+            self.pjlink_class = int(projector.get("CLSS"))
+        except (ProjectorError, AssertionError, ValueError) as exception:
+            _LOGGER.debug("Could not detect PJLink class of %s, assuming class 1", self._host)
+            self.pjlink_class = 1
+
+        if not self.is_class2:
+            return
+
+        try:
+            self.serial_number = send_class2_command(projector, "SNUM", "?")
+        except Exception as exception:
+            self.serial_number = None
+
+        try:
+            self.software_version = send_class2_command(projector, "SVER", "?")
+        except Exception as exception:
+            self.software_version = None
+
+    def __is_due(self, last_read: float | None) -> bool:
+        return last_read is None or time.monotonic() - last_read >= SLOW_SCAN_INTERVAL.total_seconds()
+
     def __has_power_by_projector(self, projector) -> bool:
         return self.__has_power_by_power_state(projector.get_power())
 
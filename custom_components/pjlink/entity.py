@@ -54,7 +54,9 @@ class PjLinkDeviceEntity(PjLinkEntity):
                 )
             },
             manufacturer=self.coordinator.data.manufacturer,
-            model=self.coordinator.data.product_name
+            model=self.coordinator.data.product_name,
+            serial_number=self.coordinator.data.serial_number,
+            sw_version=self.coordinator.data.software_version
         )
 
         return device_info
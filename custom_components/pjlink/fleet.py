@@ -0,0 +1,124 @@
+"""Site wide aggregates across all PjLink projectors."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .coordinator import PjLinkDataUpdateCoordinator
+
+FLEET_POWER_ON = "power_on"
+FLEET_ERRORS = "errors"
+FLEET_LAMP_HOURS = "lamp_hours"
+
+
+@dataclass(frozen=True)
+class PjLinkFleetContribution:
+    """Values a single projector adds to the fleet totals."""
+
+    power_on: int = 0
+    errors: int = 0
+    lamp_hours: int = 0
+
+
+NO_CONTRIBUTION = PjLinkFleetContribution()
+
+
+class PjLinkFleet:
+    """Maintain fleet totals incrementally from coordinator updates.
+
+    The fleet remembers what every coordinator last contributed, so an update
+    only applies the difference to the totals instead of iterating all projectors.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.owner_entry_id: str | None = None
+        self.totals: dict[str, int] = {
+            FLEET_POWER_ON: 0,
+            FLEET_ERRORS: 0,
+            FLEET_LAMP_HOURS: 0,
+        }
+        self._contributions: dict[str, PjLinkFleetContribution] = {}
+        self._listeners: list[CALLBACK_TYPE] = []
+        self._platforms: dict[str, AddEntitiesCallback] = {}
+
+    @callback
+    def async_add_platform(
+        self, entry_id: str, async_add_entities: AddEntitiesCallback
+    ) -> bool:
+        """Remember a sensor platform, return whether it owns the fleet sensors."""
+        self._platforms[entry_id] = async_add_entities
+        if self.owner_entry_id is None:
+            self.owner_entry_id = entry_id
+            return True
+        return False
+
+    @callback
+    def async_remove_platform(self, entry_id: str) -> AddEntitiesCallback | None:
+        """Forget a sensor platform, return the platform taking over the fleet sensors."""
+        self._platforms.pop(entry_id, None)
+        if self.owner_entry_id != entry_id:
+            return None
+
+        self.owner_entry_id = next(iter(self._platforms), None)
+        return self._platforms.get(self.owner_entry_id)
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> Callable[[], None]:
+        """Listen for changes of the fleet totals."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def async_update(self, coordinator: PjLinkDataUpdateCoordinator) -> None:
+        """Apply the latest data of a coordinator to the totals."""
+        self._async_set_contribution(
+            coordinator.data.device_id, self.__contribution(coordinator)
+        )
+
+    @callback
+    def async_remove(self, coordinator: PjLinkDataUpdateCoordinator) -> None:
+        """Withdraw a coordinator from the totals, only done when it unloads."""
+        self._async_set_contribution(coordinator.data.device_id, NO_CONTRIBUTION)
+        self._contributions.pop(coordinator.data.device_id, None)
+
+    @callback
+    def _async_set_contribution(
+        self, device_id: str, contribution: PjLinkFleetContribution
+    ) -> None:
+        previous = self._contributions.get(device_id, NO_CONTRIBUTION)
+        if contribution == previous:
+            return
+
+        self._contributions[device_id] = contribution
+        self.totals[FLEET_POWER_ON] += contribution.power_on - previous.power_on
+        self.totals[FLEET_ERRORS] += contribution.errors - previous.errors
+        self.totals[FLEET_LAMP_HOURS] += contribution.lamp_hours - previous.lamp_hours
+
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    def __contribution(
+        self, coordinator: PjLinkDataUpdateCoordinator
+    ) -> PjLinkFleetContribution:
+        data = coordinator.data
+        previous = self._contributions.get(data.device_id, NO_CONTRIBUTION)
+
+        # A failed poll keeps the old data, so nothing changed for the totals
+        if not coordinator.last_update_success:
+            return previous
+
+        return PjLinkFleetContribution(
+            power_on=int(data.power == True),
+            errors=int(any(state == "error" for state in data.errors.values())),
+            lamp_hours=previous.lamp_hours if data.lamp_hours is None else data.lamp_hours,
+        )
@@ -21,7 +21,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.util import uuid
 
 from .const import DOMAIN
-from .coordinator import PjLinkDataUpdateCoordinator
+from .coordinator import PjLinkDataUpdateCoordinator, VOLUME_UP, VOLUME_DOWN
 from .entity import PjLinkDeviceEntity
 
 _LOGGER = logging.getLogger(__name__)
@@ -117,6 +117,14 @@ class PjLinkMediaPlayer(PjLinkDeviceEntity, MediaPlayerEntity):
         self.coordinator.mute_volume(mute)
         self.async_write_ha_state()
 
+    async def async_volume_up(self) -> None:
+        """Turn the volume up one step."""
+        self.coordinator.volume_step(VOLUME_UP)
+
+    async def async_volume_down(self) -> None:
+        """Turn the volume down one step."""
+        self.coordinator.volume_step(VOLUME_DOWN)
+
     @property
     def supported_features(self) -> MediaPlayerEntityFeature:
         """Flag media player features that are supported."""
@@ -130,6 +138,9 @@ class PjLinkMediaPlayer(PjLinkDeviceEntity, MediaPlayerEntity):
         if self.coordinator.data.audio_mute is not None:
             supported_features |= MediaPlayerEntityFeature.VOLUME_MUTE
 
+        if self.coordinator.is_class2:
+            supported_features |= MediaPlayerEntityFeature.VOLUME_STEP
+
         return supported_features
 
     async def async_select_source(self, source: str) -> None:
@@ -0,0 +1,98 @@
+"""The sensor entities for PjLink."""
+
+from __future__ import annotations
+
+from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN, DATA_FLEET
+from .coordinator import PjLinkDataUpdateCoordinator
+from .entity import PjLinkCapabilityEntity
+from .fleet import PjLinkFleet, FLEET_POWER_ON, FLEET_ERRORS, FLEET_LAMP_HOURS
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up PjLink sensor based on a config entry."""
+    coordinator: PjLinkDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    fleet: PjLinkFleet = hass.data[DATA_FLEET]
+
+    entities: list = []
+
+    if coordinator.is_class2:
+        entities.append(PjLinkFilterUsageSensor("filter_usage", "Filter usage", coordinator))
+
+    # The fleet sensors exist once per site, the first projector provides them
+    if fleet.async_add_platform(entry.entry_id, async_add_entities):
+        entities.extend(create_fleet_sensors(fleet))
+
+    async_add_entities(entities)
+
+
+def create_fleet_sensors(fleet: PjLinkFleet) -> list[PjLinkFleetSensor]:
+    """Create the site wide aggregate sensors."""
+    return [
+        PjLinkFleetSensor(FLEET_POWER_ON, "PJLink projectors on", "mdi:projector", None, fleet),
+        PjLinkFleetSensor(FLEET_ERRORS, "PJLink projectors with errors", "mdi:alert-circle", None, fleet),
+        PjLinkFleetSensor(FLEET_LAMP_HOURS, "PJLink total lamp hours", "mdi:lightbulb", UnitOfTime.HOURS, fleet),
+    ]
+
+
+class PjLinkFilterUsageSensor(PjLinkCapabilityEntity, SensorEntity):
+    """Representation of the PjLink filter usage time."""
+
+    _attr_native_unit_of_measurement = UnitOfTime.HOURS
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    def __init__(
+        self,
+        id: str,
+        name: str,
+        coordinator: PjLinkDataUpdateCoordinator
+    ) -> None:
+        """Initialize the PjLink filter usage sensor."""
+        PjLinkCapabilityEntity.__init__(self, id, name, "mdi:air-filter", coordinator)
+
+    @property
+    def native_value(self) -> int | None:
+        """Return the filter usage time, unknown while the projector can't answer."""
+        return self.coordinator.data.filter_hours
+
+
+class PjLinkFleetSensor(SensorEntity):
+    """Representation of a site wide PjLink aggregate."""
+
+    _attr_should_poll = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(
+        self,
+        id: str,
+        name: str,
+        icon: str,
+        unit: str | None,
+        fleet: PjLinkFleet
+    ) -> None:
+        """Initialize the PjLink fleet sensor."""
+        self.fleet = fleet
+        self.aggregate_id = id
+        self._attr_name = name
+        self._attr_icon = icon
+        self._attr_native_unit_of_measurement = unit
+        self._attr_unique_id = f"{DOMAIN}_fleet_{id}"
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to fleet updates."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.fleet.async_add_listener(self.async_write_ha_state))
+
+    @property
+    def native_value(self) -> int:
+        """Return the current aggregate."""
+        return self.fleet.totals[self.aggregate_id]
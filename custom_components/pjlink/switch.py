@@ -30,6 +30,9 @@ async def async_setup_entry(
     if coordinator.data.video_mute is not None:
         entities.append(PjLinkVideoMuteSwitch("video_mute", "Video Mute", coordinator))
 
+    if coordinator.is_class2:
+        entities.append(PjLinkFreezeSwitch("freeze", "Freeze", coordinator))
+
     async_add_entities(entities)
 
 
@@ -106,4 +109,29 @@ class PjLinkVideoMuteSwitch(PjLinkCapabilityEntity, SwitchEntity):
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the capability."""
-        self.coordinator.mute_video(False)
\ No newline at end of file
+        self.coordinator.mute_video(False)
+
+class PjLinkFreezeSwitch(PjLinkCapabilityEntity, SwitchEntity):
+    """Representation of a PjLink freeze switch."""
+
+    def __init__(
+        self,
+        id: str,
+        name: str,
+        coordinator: PjLinkDataUpdateCoordinator
+    ) -> None:
+        """Initialize the PjLink freeze switch."""
+        PjLinkCapabilityEntity.__init__(self, id, name, "mdi:pause-box", coordinator)
+
+    @property
+    def is_on(self) -> bool | None:
+        """Return the current status, unknown while the projector can't answer."""
+        return self.coordinator.data.freeze
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        """Turn on the capability."""
+        self.coordinator.freeze(True)
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        """Turn off the capability."""
+        self.coordinator.freeze(False)
\ No newline at end of file
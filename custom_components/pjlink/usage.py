@@ -0,0 +1,190 @@
+"""Hourly usage statistics of a PjLink projector."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+import logging
+from typing import NamedTuple
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    get_last_statistics,
+)
+from homeassistant.const import UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util, slugify
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+USAGE_ON_TIME = "on_time"
+USAGE_POWER_CYCLES = "power_cycles"
+USAGE_INPUT = "input"
+
+HOUR = timedelta(hours=1)
+
+
+def start_of_hour(moment: datetime) -> datetime:
+    """Return the start of the hour containing moment."""
+    return moment.replace(minute=0, second=0, microsecond=0)
+
+
+class PjLinkUsageSample(NamedTuple):
+    """State of the projector at a point in time."""
+
+    time: datetime
+    power: bool
+    input: str | None
+
+
+class PjLinkStatisticRow(NamedTuple):
+    """Latest row of a statistic known to the recorder."""
+
+    start: datetime
+    state: float
+    sum: float
+
+
+class PjLinkUsageTracker:
+    """Accumulate on time, input usage and power cycles in hourly buckets.
+
+    The buckets are kept in memory and imported into the long-term statistics
+    once their hour has passed, and including the current hour when Home
+    Assistant stops or the entry unloads, so reports never scan the state history.
+    """
+
+    def __init__(self, hass: HomeAssistant, device_id: str, name: str) -> None:
+        """Initialize."""
+        self.hass = hass
+        self._device_id = device_id
+        self._name = name
+
+        self._sample: PjLinkUsageSample | None = None
+        self._power: bool | None = None
+        self._hour: datetime | None = None
+        self._buckets: dict[datetime, dict[str, float]] = {}
+        self._names: dict[str, tuple[str, str | None]] = {
+            USAGE_ON_TIME: (f"{name} on time", UnitOfTime.HOURS),
+            USAGE_POWER_CYCLES: (f"{name} power cycles", None),
+        }
+        self._last_rows: dict[str, PjLinkStatisticRow | None] = {}
+        self._lock = asyncio.Lock()
+        self._flush_tasks: set[asyncio.Task] = set()
+
+    @callback
+    def async_update(self, power: bool | None, input: str | None) -> None:
+        """Account the time since the previous sample and remember the new state."""
+        now = dt_util.utcnow()
+        previous = self._sample
+
+        if previous is not None and previous.power:
+            self.__add_duration(USAGE_ON_TIME, previous.time, now)
+            if previous.input is not None:
+                self.__add_duration(self.__input_metric(previous.input), previous.time, now)
+
+        # Power cycles compare with the last known state, also across failed polls
+        if self._power == False and power == True:
+            self.__add(USAGE_POWER_CYCLES, start_of_hour(now), 1)
+        if power is not None:
+            self._power = power
+
+        # Without a known power state the time until the next sample is not counted
+        self._sample = None if power is None else PjLinkUsageSample(now, power, input)
+
+        hour = start_of_hour(now)
+        if self._hour is not None and hour != self._hour:
+            task = self.hass.async_create_task(self.async_flush())
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+        self._hour = hour
+
+    async def async_flush(self, include_current: bool = False) -> None:
+        """Import the finished hours, or all hours, into the long-term statistics."""
+        if include_current and self._flush_tasks:
+            # Let pending hour boundary flushes finish before the final one
+            await asyncio.gather(*self._flush_tasks)
+
+        async with self._lock:
+            current = start_of_hour(dt_util.utcnow())
+            hours = sorted(hour for hour in self._buckets if include_current or hour < current)
+            buckets = [(hour, self._buckets.pop(hour)) for hour in hours]
+
+            metrics = {metric for _, values in buckets for metric in values}
+            for metric in sorted(metrics):
+                await self.__async_import(metric, buckets)
+
+    async def __async_import(
+        self, metric: str, buckets: list[tuple[datetime, dict[str, float]]]
+    ) -> None:
+        statistic_id = f"{DOMAIN}:{slugify(self._device_id)}_{metric}"
+        name, unit = self._names[metric]
+
+        if metric not in self._last_rows:
+            self._last_rows[metric] = await self.__async_last_row(statistic_id)
+        last = self._last_rows[metric]
+
+        statistics: list[StatisticData] = []
+        for hour, values in buckets:
+            if metric not in values:
+                continue
+            value = values[metric]
+
+            if last is None:
+                last = PjLinkStatisticRow(hour, value, value)
+            elif hour > last.start:
+                last = PjLinkStatisticRow(hour, value, last.sum + value)
+            elif hour == last.start:
+                # The hour was partially imported before, e.g. prior to a reload
+                last = PjLinkStatisticRow(hour, last.state + value, last.sum + value)
+            else:
+                _LOGGER.debug("Skipping %s for %s, a newer hour is already stored", statistic_id, hour)
+                continue
+
+            statistics.append(StatisticData(start=last.start, state=last.state, sum=last.sum))
+
+        self._last_rows[metric] = last
+        if not statistics:
+            return
+
+        metadata = StatisticMetaData(
+            has_mean=False,
+            has_sum=True,
+            name=name,
+            source=DOMAIN,
+            statistic_id=statistic_id,
+            unit_of_measurement=unit,
+        )
+        async_add_external_statistics(self.hass, metadata, statistics)
+
+    async def __async_last_row(self, statistic_id: str) -> PjLinkStatisticRow | None:
+        result = await get_instance(self.hass).async_add_executor_job(
+            get_last_statistics, self.hass, 1, statistic_id, True, {"state", "sum"}
+        )
+        if not result.get(statistic_id):
+            return None
+
+        row = result[statistic_id][0]
+        return PjLinkStatisticRow(
+            dt_util.utc_from_timestamp(row["start"]), row["state"] or 0, row["sum"] or 0
+        )
+
+    def __input_metric(self, input: str) -> str:
+        metric = f"{USAGE_INPUT}_{slugify(input)}"
+        self._names.setdefault(metric, (f"{self._name} {input} time", UnitOfTime.HOURS))
+        return metric
+
+    def __add_duration(self, metric: str, start: datetime, end: datetime) -> None:
+        """Split the interval at hour boundaries and add it in hours."""
+        while start < end:
+            hour = start_of_hour(start)
+            until = min(end, hour + HOUR)
+            self.__add(metric, hour, (until - start).total_seconds() / 3600)
+            start = until
+
+    def __add(self, metric: str, hour: datetime, value: float) -> None:
+        values = self._buckets.setdefault(hour, {})
+        values[metric] = values.get(metric, 0) + value